@@ -6,19 +6,30 @@ Usage:
     python3 scripts/generate_assets.py nexuspvr
     python3 scripts/generate_assets.py dispatcherpvr
     python3 scripts/generate_assets.py all
+    python3 scripts/generate_assets.py all --fast   # light PNG compression
+    python3 scripts/generate_assets.py all --force  # ignore the unchanged-file manifest
 
-Requires Pillow:
+Requires Pillow and NumPy:
     python3 -m venv /private/tmp/imgvenv
     source /private/tmp/imgvenv/bin/activate
-    pip install Pillow
+    pip install Pillow numpy
+
+On x86-64 hosts Pillow-SIMD is an API-compatible drop-in with SSE4/AVX2 resize, blur
+and alpha compositing (no gain on Apple Silicon):
+    pip uninstall -y Pillow && pip install pillow-simd
 """
 
 import argparse
+import concurrent.futures
+import functools
+import hashlib
 import json
 import math
 import os
+import shutil
 import sys
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFilter
 
 # ---------------------------------------------------------------------------
@@ -60,20 +71,53 @@ BRANDS = {
 
 def create_radial_gradient(width, height, center_color, edge_color):
     """Create a radial gradient image from center_color to edge_color."""
-    img = Image.new("RGB", (width, height))
-    pixels = img.load()
     cx, cy = width / 2, height / 2
     max_dist = math.sqrt((width / 2) ** 2 + (height / 2) ** 2)
 
-    for y in range(height):
-        for x in range(width):
-            dist = math.sqrt((x - cx) ** 2 + (y - cy) ** 2)
-            ratio = min(dist / max_dist, 1.0) ** 0.8  # ease for smoother falloff
-            r = int(center_color[0] + (edge_color[0] - center_color[0]) * ratio)
-            g = int(center_color[1] + (edge_color[1] - center_color[1]) * ratio)
-            b = int(center_color[2] + (edge_color[2] - center_color[2]) * ratio)
-            pixels[x, y] = (r, g, b)
-    return img
+    y, x = np.ogrid[0:height, 0:width]
+    dist = np.hypot(x - cx, y - cy)
+    ratio = np.minimum(dist / max_dist, 1.0) ** 0.8  # ease for smoother falloff
+
+    center = np.array(center_color, dtype=np.float64)
+    edge = np.array(edge_color, dtype=np.float64)
+    arr = center + (edge - center) * ratio[..., None]
+    return Image.fromarray(arr.astype(np.uint8), "RGB")
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_radial_gradient(width, height, center_color, edge_color):
+    """Memoized create_radial_gradient. Treat the result as read-only; copy() before mutating."""
+    return create_radial_gradient(width, height, center_color, edge_color)
+
+
+@functools.lru_cache(maxsize=None)
+def _rounded_mask(width, height, radius):
+    """Memoized rounded-corner "L" mask covering (width, height). Treat as read-only."""
+    mask = Image.new("L", (width, height), 0)
+    ImageDraw.Draw(mask).rounded_rectangle([0, 0, width, height], radius=radius, fill=255)
+    return mask
+
+
+@functools.lru_cache(maxsize=None)
+def _glow(glow_size, color):
+    """Memoized soft RGBA glow disc (blurred ellipse at alpha 30). Treat as read-only."""
+    glow = Image.new("RGBA", (glow_size, glow_size), (0, 0, 0, 0))
+    ImageDraw.Draw(glow).ellipse([0, 0, glow_size, glow_size], fill=(color[0], color[1], color[2], 30))
+    return glow.filter(ImageFilter.GaussianBlur(radius=glow_size // 4))
+
+
+def _composite_centred(canvas, layer):
+    """Alpha-composite layer centred on canvas in place, blending only the overlap.
+
+    Equivalent to compositing a canvas-sized transparent layer with layer pasted
+    centred, but touches only the covered pixels. layer may exceed the canvas.
+    """
+    x = (canvas.width - layer.width) // 2
+    y = (canvas.height - layer.height) // 2
+    sx, sy = max(-x, 0), max(-y, 0)
+    w = min(layer.width - sx, canvas.width - max(x, 0))
+    h = min(layer.height - sy, canvas.height - max(y, 0))
+    canvas.alpha_composite(layer, dest=(max(x, 0), max(y, 0)), source=(sx, sy, sx + w, sy + h))
 
 
 def draw_play_button(draw, cx, cy, scale, color=(255, 255, 255, 255)):
@@ -102,29 +146,25 @@ def draw_recording_dot(draw, cx, cy, scale, dot_color):
 
 def create_app_icon(size, brand):
     """Square app icon with radial gradient, rounded corners, play button, dot."""
-    bg = create_radial_gradient(size, size, brand["gradient_center"], brand["gradient_edge"])
+    bg = _cached_radial_gradient(size, size, brand["gradient_center"], brand["gradient_edge"])
 
     # Rounded-corner mask
-    mask = Image.new("L", (size, size), 0)
-    ImageDraw.Draw(mask).rounded_rectangle([0, 0, size, size], radius=int(size * 0.22), fill=255)
+    mask = _rounded_mask(size, size, int(size * 0.22))
 
     rounded = Image.new("RGB", (size, size), brand["gradient_edge"])
     rounded.paste(bg, (0, 0), mask)
 
-    # Foreground overlay
-    overlay = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
+    # Foreground shapes are fully opaque, so draw them straight onto the RGB
+    # image instead of compositing an RGBA overlay (the fill alpha is ignored).
+    draw = ImageDraw.Draw(rounded)
     s = size / 1024.0 * 2.5
     draw_play_button(draw, size / 2, size / 2, s)
     draw_recording_dot(draw, size / 2, size / 2, s, brand["recording_dot"])
-
-    result = Image.new("RGBA", (size, size))
-    result.paste(rounded, (0, 0))
-    return Image.alpha_composite(result, overlay).convert("RGB")
+    return rounded
 
 
 def create_tvos_back(width, height, brand):
-    return create_radial_gradient(width, height, brand["gradient_center"], brand["gradient_edge"])
+    return _cached_radial_gradient(width, height, brand["gradient_center"], brand["gradient_edge"]).copy()
 
 
 def create_tvos_front(width, height, brand):
@@ -143,28 +183,23 @@ def create_tvos_middle(width, height):
 def create_shelf_image(width, height, brand):
     """Top shelf image: app icon centred on dark background with subtle glow."""
     bg_color = tuple(int(c * 255) for c in brand["launch_bg_rgb"])
-    img = Image.new("RGB", (width, height), bg_color)
+    # Opaque RGBA from the start: the glow composite needs alpha, and this
+    # avoids allocating an RGB canvas only to convert() it.
+    img_rgba = Image.new("RGBA", (width, height), bg_color + (255,))
 
     # Centred icon
     icon_h = int(height * 0.6)
     icon_w = icon_h
-    icon_bg = create_radial_gradient(icon_w, icon_h, brand["gradient_center"], brand["gradient_edge"])
+    icon_bg = _cached_radial_gradient(icon_w, icon_h, brand["gradient_center"], brand["gradient_edge"])
 
     # Rounded mask
-    mask = Image.new("L", (icon_w, icon_h), 0)
-    ImageDraw.Draw(mask).rounded_rectangle([0, 0, icon_w, icon_h], radius=int(icon_h * 0.15), fill=255)
+    mask = _rounded_mask(icon_w, icon_h, int(icon_h * 0.15))
 
     # Subtle glow
     glow_size = int(icon_h * 1.4)
-    glow = Image.new("RGBA", (glow_size, glow_size), (0, 0, 0, 0))
-    gc = brand["gradient_center"]
-    ImageDraw.Draw(glow).ellipse([0, 0, glow_size, glow_size], fill=(gc[0], gc[1], gc[2], 30))
-    glow = glow.filter(ImageFilter.GaussianBlur(radius=glow_size // 4))
+    glow = _glow(glow_size, brand["gradient_center"])
 
-    img_rgba = img.convert("RGBA")
-    glow_layer = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    glow_layer.paste(glow, ((width - glow_size) // 2, (height - glow_size) // 2))
-    img_rgba = Image.alpha_composite(img_rgba, glow_layer)
+    _composite_centred(img_rgba, glow)
 
     # Paste icon
     ix, iy = (width - icon_w) // 2, (height - icon_h) // 2
@@ -181,10 +216,8 @@ def create_shelf_image(width, height, brand):
 
 def create_launch_logo(size, brand):
     """Launch-screen logo: icon with transparent background."""
-    bg = create_radial_gradient(size, size, brand["gradient_center"], brand["gradient_edge"])
-
-    mask = Image.new("L", (size, size), 0)
-    ImageDraw.Draw(mask).rounded_rectangle([0, 0, size, size], radius=int(size * 0.22), fill=255)
+    bg = _cached_radial_gradient(size, size, brand["gradient_center"], brand["gradient_edge"])
+    mask = _rounded_mask(size, size, int(size * 0.22))
 
     result = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     result.paste(bg, (0, 0), mask)
@@ -205,8 +238,12 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 VHS_SOURCE = os.path.join(SCRIPT_DIR, "vhs_source.png")
 
 
+@functools.lru_cache(maxsize=1)
 def _load_vhs_source():
-    """Load the VHS source image (black cassette, transparent bg, mirrored)."""
+    """Load the VHS source image (black cassette, transparent bg, mirrored).
+
+    Decoded once per run; callers only resize it, so the cached image is shared.
+    """
     return Image.open(VHS_SOURCE).convert("RGBA")
 
 
@@ -232,27 +269,23 @@ def _place_vhs_on_canvas(canvas_w, canvas_h, vhs_fraction=0.85, with_triangle=Tr
         tri_cy = paste_y + int(new_h * 0.422)
         tri_size = int(new_h * 0.055)
         angle = math.radians(22)
+        ca, sa = math.cos(angle), math.sin(angle)
 
-        def rot(px, py, cx, cy, a):
-            dx, dy = px - cx, py - cy
-            return cx + dx * math.cos(a) - dy * math.sin(a), cy + dx * math.sin(a) + dy * math.cos(a)
-
+        # Triangle vertices relative to its centre, rotated by angle
+        offsets = [(-0.5, -0.7), (-0.5, 0.7), (0.8, 0.0)]
         pts = [
-            (tri_cx - tri_size * 0.5, tri_cy - tri_size * 0.7),
-            (tri_cx - tri_size * 0.5, tri_cy + tri_size * 0.7),
-            (tri_cx + tri_size * 0.8, tri_cy),
+            (tri_cx + (dx * ca - dy * sa) * tri_size, tri_cy + (dx * sa + dy * ca) * tri_size)
+            for dx, dy in offsets
         ]
-        draw.polygon([rot(*p, tri_cx, tri_cy, angle) for p in pts], fill=(220, 40, 30, 255))
+        draw.polygon(pts, fill=(220, 40, 30, 255))
 
     return canvas
 
 
 def create_vhs_icon(size, brand):
     """Square app icon: VHS cassette on branded gradient background."""
-    bg = create_radial_gradient(size, size, brand["gradient_center"], brand["gradient_edge"])
-    mask = Image.new("L", (size, size), 0)
-    ImageDraw.Draw(mask).rounded_rectangle([0, 0, size, size],
-                                           radius=int(size * 0.22), fill=255)
+    bg = _cached_radial_gradient(size, size, brand["gradient_center"], brand["gradient_edge"])
+    mask = _rounded_mask(size, size, int(size * 0.22))
     result = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     result.paste(bg, (0, 0), mask)
 
@@ -276,19 +309,12 @@ def create_vhs_launch_logo(size, brand):
 def create_vhs_shelf_image(width, height, brand):
     """Top shelf: VHS cassette centred on dark background with glow."""
     bg_color = tuple(int(c * 255) for c in brand["launch_bg_rgb"])
-    img = Image.new("RGB", (width, height), bg_color)
+    img_rgba = Image.new("RGBA", (width, height), bg_color + (255,))
 
-    gc = brand["gradient_center"]
     glow_size = int(height * 1.2)
-    glow = Image.new("RGBA", (glow_size, glow_size), (0, 0, 0, 0))
-    ImageDraw.Draw(glow).ellipse([0, 0, glow_size, glow_size],
-                                 fill=(gc[0], gc[1], gc[2], 30))
-    glow = glow.filter(ImageFilter.GaussianBlur(radius=glow_size // 4))
+    glow = _glow(glow_size, brand["gradient_center"])
 
-    img_rgba = img.convert("RGBA")
-    glow_layer = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    glow_layer.paste(glow, ((width - glow_size) // 2, (height - glow_size) // 2))
-    img_rgba = Image.alpha_composite(img_rgba, glow_layer)
+    _composite_centred(img_rgba, glow)
 
     vhs_layer = _place_vhs_on_canvas(width, height, vhs_fraction=0.50)
     img_rgba = Image.alpha_composite(img_rgba, vhs_layer)
@@ -311,36 +337,68 @@ CRT_SCANLINE = (20, 50, 30)
 CRT_BEZEL = (24, 40, 30)
 
 
+# CRT geometry on the 200x200 reference grid. Points are (x, y) and get the
+# centring offset added; lengths (radii, stroke widths, insets) are only scaled.
+_CRT_POINTS = {
+    "body_tl": (30, 45), "body_br": (170, 155),
+    "screen_tl": (40, 55), "screen_br": (145, 135),
+    "rec": (155, 60),
+    "knob_top": (155, 110), "knob_bottom": (155, 130),
+    "ant_bl": (70, 45), "ant_br": (130, 45), "ant_tl": (50, 18), "ant_tr": (150, 18),
+    "leg_l_top": (55, 155), "leg_l_foot": (45, 175),
+    "leg_r_top": (145, 155), "leg_r_foot": (155, 175),
+    "foot_l_a": (38, 175), "foot_l_b": (52, 175),
+    "foot_r_a": (148, 175), "foot_r_b": (162, 175),
+}
+_CRT_LENGTHS = {
+    "size": 200, "body_r": 12, "bezel_inset": 2, "bezel_r": 10, "bezel_w": 1.5,
+    "screen_r": 8, "scan_step": 4, "rec_r": 3, "rec_r_small": 2,
+    "knob_r": 4, "knob_r_small": 3, "ant_w": 2.5, "tip_r": 2.5, "leg_w": 3, "foot_w": 4,
+}
+
+
+def _crt_layout(s, width, height):
+    """Scale the CRT reference geometry by s, centred in (width, height).
+
+    Returns (points, lengths) dicts of ints, truncated like int(v * s).
+    """
+    lengths = {name: int(v * s) for name, v in _CRT_LENGTHS.items()}
+    ox = (width - lengths["size"]) // 2
+    oy = (height - lengths["size"]) // 2
+    points = {name: (ox + int(x * s), oy + int(y * s)) for name, (x, y) in _CRT_POINTS.items()}
+    return points, lengths
+
+
 def _draw_crt_on(draw, width, height, s, include_bg=True):
     """Draw CRT TV elements scaled by factor s on a draw context.
 
     Coordinates are based on a 200x200 reference, offset to centre in (width, height).
     """
-    ox = (width - int(200 * s)) // 2
-    oy = (height - int(200 * s)) // 2
+    p, n = _crt_layout(s, width, height)
+    small = n["size"] <= 32
 
     if include_bg:
         draw.rectangle([0, 0, width, height], fill=CRT_BG)
 
     # TV body
-    bx1, by1 = ox + int(30 * s), oy + int(45 * s)
-    bx2, by2 = ox + int(170 * s), oy + int(155 * s)
-    draw.rounded_rectangle([bx1, by1, bx2, by2], radius=int(12 * s), fill=CRT_TV_BODY)
+    (bx1, by1), (bx2, by2) = p["body_tl"], p["body_br"]
+    draw.rounded_rectangle([bx1, by1, bx2, by2], radius=n["body_r"], fill=CRT_TV_BODY)
 
     # Bezel
+    inset = n["bezel_inset"]
     draw.rounded_rectangle(
-        [bx1 + int(2 * s), by1 + int(2 * s), bx2 - int(2 * s), by2 - int(2 * s)],
-        radius=int(10 * s), outline=CRT_BEZEL, width=max(int(1.5 * s), 1),
+        [bx1 + inset, by1 + inset, bx2 - inset, by2 - inset],
+        radius=n["bezel_r"], outline=CRT_BEZEL, width=max(n["bezel_w"], 1),
     )
 
     # Screen
-    sx1, sy1 = ox + int(40 * s), oy + int(55 * s)
-    sx2, sy2 = ox + int(145 * s), oy + int(135 * s)
-    draw.rounded_rectangle([sx1, sy1, sx2, sy2], radius=int(8 * s), fill=CRT_SCREEN)
+    (sx1, sy1), (sx2, sy2) = p["screen_tl"], p["screen_br"]
+    draw.rounded_rectangle([sx1, sy1, sx2, sy2], radius=n["screen_r"], fill=CRT_SCREEN)
 
-    # Scan lines
-    for y_line in range(sy1, sy2, max(int(4 * s), 2)):
-        draw.line([(sx1, y_line), (sx2, y_line)], fill=CRT_SCANLINE, width=1)
+    # Scan lines: one bitmap stamp instead of a draw.line call per row
+    scan = np.zeros((sy2 - sy1, sx2 - sx1 + 1), dtype=np.uint8)
+    scan[::max(n["scan_step"], 2)] = 255
+    draw.bitmap((sx1, sy1), Image.fromarray(scan, "L"), fill=CRT_SCANLINE)
 
     # Play triangle on screen
     scx = (sx1 + sx2) / 2
@@ -354,44 +412,55 @@ def _draw_crt_on(draw, width, height, s, include_bg=True):
     draw.polygon(points, fill=CRT_PLAY)
 
     # REC dot — proportional, smaller at small sizes
-    rec_r = max(int(3 * s), 1)
-    if int(200 * s) <= 32:
-        rec_r = max(int(2 * s), 1)
-    rec_cx = ox + int(155 * s)
-    rec_cy = oy + int(60 * s)
+    rec_r = max(n["rec_r_small"] if small else n["rec_r"], 1)
+    rec_cx, rec_cy = p["rec"]
     draw.ellipse(
         [rec_cx - rec_r, rec_cy - rec_r, rec_cx + rec_r, rec_cy + rec_r],
         fill=CRT_REC,
     )
 
     # Knobs
-    k1x, k1y = ox + int(155 * s), oy + int(110 * s)
-    k2x, k2y = ox + int(155 * s), oy + int(130 * s)
-    kr = max(int(4 * s), 2)
-    if int(200 * s) <= 32:
-        kr = max(int(3 * s), 1)
-    draw.ellipse([k1x - kr, k1y - kr, k1x + kr, k1y + kr], fill=CRT_KNOB)
-    draw.ellipse([k2x - kr, k2y - kr, k2x + kr, k2y + kr], fill=CRT_KNOB)
+    kr = max(n["knob_r_small"], 1) if small else max(n["knob_r"], 2)
+    for kx, ky in (p["knob_top"], p["knob_bottom"]):
+        draw.ellipse([kx - kr, ky - kr, kx + kr, ky + kr], fill=CRT_KNOB)
 
     # Antennas
-    aw = max(int(2.5 * s), 1)
-    ant_bl = (ox + int(70 * s), oy + int(45 * s))
-    ant_br = (ox + int(130 * s), oy + int(45 * s))
-    ant_tl = (ox + int(50 * s), oy + int(18 * s))
-    ant_tr = (ox + int(150 * s), oy + int(18 * s))
-    draw.line([ant_bl, ant_tl], fill=CRT_ANTENNA, width=aw)
-    draw.line([ant_br, ant_tr], fill=CRT_ANTENNA, width=aw)
-    tip_r = max(int(2.5 * s), 1)
-    for t in (ant_tl, ant_tr):
+    aw = max(n["ant_w"], 1)
+    draw.line([p["ant_bl"], p["ant_tl"]], fill=CRT_ANTENNA, width=aw)
+    draw.line([p["ant_br"], p["ant_tr"]], fill=CRT_ANTENNA, width=aw)
+    tip_r = max(n["tip_r"], 1)
+    for t in (p["ant_tl"], p["ant_tr"]):
         draw.ellipse([t[0] - tip_r, t[1] - tip_r, t[0] + tip_r, t[1] + tip_r], fill=CRT_ANTENNA)
 
     # Legs
-    lw = max(int(3 * s), 1)
-    draw.line([(ox + int(55 * s), oy + int(155 * s)), (ox + int(45 * s), oy + int(175 * s))], fill=CRT_LEG, width=lw)
-    draw.line([(ox + int(145 * s), oy + int(155 * s)), (ox + int(155 * s), oy + int(175 * s))], fill=CRT_LEG, width=lw)
-    fw = max(int(4 * s), 2)
-    draw.line([(ox + int(38 * s), oy + int(175 * s)), (ox + int(52 * s), oy + int(175 * s))], fill=CRT_LEG, width=fw)
-    draw.line([(ox + int(148 * s), oy + int(175 * s)), (ox + int(162 * s), oy + int(175 * s))], fill=CRT_LEG, width=fw)
+    lw = max(n["leg_w"], 1)
+    draw.line([p["leg_l_top"], p["leg_l_foot"]], fill=CRT_LEG, width=lw)
+    draw.line([p["leg_r_top"], p["leg_r_foot"]], fill=CRT_LEG, width=lw)
+    fw = max(n["foot_w"], 2)
+    draw.line([p["foot_l_a"], p["foot_l_b"]], fill=CRT_LEG, width=fw)
+    draw.line([p["foot_r_a"], p["foot_r_b"]], fill=CRT_LEG, width=fw)
+
+
+@functools.lru_cache(maxsize=2)
+def _crt_layer(s):
+    """Memoized CRT TV at scale s on a transparent int(200 * s) square. Treat as read-only.
+
+    Every CRT shape is drawn opaque and inside the 200x200 reference box, so
+    pasting this layer centred matches drawing straight onto the canvas. Only
+    the shelves use it: standard and wide shelves of one height share a scale,
+    and the two shelf heights are the only live entries.
+    """
+    size = int(200 * s)
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    _draw_crt_on(ImageDraw.Draw(img), size, size, s, include_bg=False)
+    return img
+
+
+def _paste_crt_layer(canvas, s):
+    """Paste the cached CRT layer for scale s centred on canvas, as _draw_crt_on would place it."""
+    layer = _crt_layer(s)
+    offset = ((canvas.width - layer.width) // 2, (canvas.height - layer.height) // 2)
+    canvas.paste(layer, offset, layer)
 
 
 def create_crt_icon(size, brand):
@@ -427,12 +496,12 @@ def create_crt_launch_logo(size, brand):
 
 
 def create_crt_shelf_image(width, height, brand):
-    """Top shelf: CRT TV centred on dark background."""
-    bg_color = tuple(int(c * 255) for c in brand["launch_bg_rgb"])
-    img = Image.new("RGB", (width, height), bg_color)
-    draw = ImageDraw.Draw(img)
-    s = min(width, height) / 200.0 * 0.6
-    _draw_crt_on(draw, width, height, s)
+    """Top shelf: CRT TV centred on the CRT background.
+
+    Standard and wide shelves of the same height share one cached CRT layer.
+    """
+    img = Image.new("RGB", (width, height), CRT_BG)
+    _paste_crt_layer(img, min(width, height) / 200.0 * 0.6)
     return img
 
 
@@ -500,16 +569,86 @@ def write_launch_bg_colorset(assets_dir, rgb):
 # Main
 # ---------------------------------------------------------------------------
 
-def save(img, path, force_rgb=False):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    if force_rgb and img.mode != "RGB":
-        img = img.convert("RGB")
-    img.save(path)
-    kb = os.path.getsize(path) // 1024
-    print(f"  {os.path.basename(path)} ({img.size[0]}x{img.size[1]}, {img.mode}) — {kb}KB")
+# zlib level for PNG output: Pillow's default for committed assets, and a
+# cheap level for --fast iteration (Xcode's asset compiler recompresses anyway).
+PNG_COMPRESS_LEVEL = 6
+PNG_COMPRESS_LEVEL_FAST = 1
+
+
+# Per-file record of the pixels last written plus the resulting file's size and
+# mtime, so unchanged PNGs are not re-encoded. A checkout, stash or hand edit
+# changes the file's stat and forces a rewrite. Local build cache only; delete
+# it or pass --force to rewrite everything.
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".asset_manifest.json")
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
 
-def generate(brand_key):
+def write_manifest(manifest):
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def save(img, path, force_rgb=False, compress_level=PNG_COMPRESS_LEVEL, manifest=None, copies=()):
+    """Write img to path and return its summary line(s). Safe to call from worker threads.
+
+    With a manifest, the write is skipped when the recorded digest matches the
+    image's mode, size, pixels and compression level and the file on disk still
+    has the size and mtime recorded when it was written.
+    Each path in copies receives a byte copy of the encoded file instead of
+    a second encode.
+    """
+    if force_rgb and img.mode != "RGB":
+        img = img.convert("RGB")
+    digest = None
+    if manifest is not None:
+        h = hashlib.blake2b(f"{img.mode}:{img.size}:{compress_level}:".encode(), digest_size=16)
+        h.update(img.tobytes())
+        digest = h.hexdigest()
+
+    def entry(target):
+        st = os.stat(target)
+        return {"pixels": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def manifest_key(target):
+        return os.path.relpath(target, os.path.dirname(os.path.dirname(MANIFEST_PATH)))
+
+    def unchanged(target):
+        if digest is None or not os.path.exists(target):
+            return False
+        return manifest.get(manifest_key(target)) == entry(target)
+
+    lines = []
+    for target in (path, *copies):
+        status = " (unchanged)" if unchanged(target) else ""
+        if not status:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if target == path:
+                img.save(path, format="PNG", compress_level=compress_level, optimize=False)
+            else:
+                shutil.copyfile(path, target)
+            if digest is not None:
+                manifest[manifest_key(target)] = entry(target)
+        kb = os.path.getsize(target) // 1024
+        lines.append(f"  {os.path.basename(target)} ({img.size[0]}x{img.size[1]}, {img.mode}) — {kb}KB{status}")
+    return "\n".join(lines)
+
+
+def _downscale(master, width, height):
+    """Lanczos-downsample a master render to (width, height); returns master itself at full size."""
+    if master.size == (width, height):
+        return master
+    return master.resize((width, height), Image.LANCZOS)
+
+
+def generate(brand_key, fast=False, manifest=None):
     brand = BRANDS[brand_key]
     root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     assets = os.path.join(root, brand["assets_dir"])
@@ -519,8 +658,20 @@ def generate(brand_key):
     print(f"  {brand['name']} Assets {'(CRT TV style)' if is_crt else ''}")
     print(f"{'='*50}\n")
 
+    # Images are built here and PNG-encoded on the pool (Pillow releases the
+    # GIL while encoding); the log keeps headings and results in order.
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+    compress_level = PNG_COMPRESS_LEVEL_FAST if fast else PNG_COMPRESS_LEVEL
+    log = []
+
+    def heading(text):
+        log.append(text)
+
+    def write(img, path, force_rgb=False, copies=()):
+        log.append(pool.submit(save, img, path, force_rgb, compress_level, manifest, copies))
+
     # ── App Icons ──────────────────────────────────────
-    print("App Icons:")
+    heading("App Icons:")
     icon_dir = os.path.join(assets, "AppIcon.appiconset")
     icon_sizes = {
         "AppIcon-1024.png": 1024,
@@ -535,57 +686,73 @@ def generate(brand_key):
         "AppIcon-16@2x.png": 32,
         "AppIcon-16.png": 16,
     }
-    cache = {}
+    # Gradient icons are rendered once at full size and downsampled; CRT icons
+    # are drawn per size because _draw_crt_on hand-tunes strokes for small sizes.
+    master = None if is_crt else create_app_icon(max(icon_sizes.values()), brand)
+    # Several slots share a pixel size (e.g. 512@2x and 1024): encode each size
+    # once and byte-copy the PNG to the other slots.
+    paths_by_size = {}
     for filename, sz in icon_sizes.items():
-        if sz not in cache:
-            cache[sz] = create_crt_icon(sz, brand) if is_crt else create_app_icon(sz, brand)
-        save(cache[sz], os.path.join(icon_dir, filename), force_rgb=True)
+        paths_by_size.setdefault(sz, []).append(os.path.join(icon_dir, filename))
+    for sz, paths in paths_by_size.items():
+        icon = create_crt_icon(sz, brand) if is_crt else _downscale(master, sz, sz)
+        write(icon, paths[0], force_rgb=True, copies=paths[1:])
 
     # ── Launch Logo ────────────────────────────────────
-    print("\nLaunch Logo:")
+    heading("\nLaunch Logo:")
     logo_dir = os.path.join(assets, "LaunchLogo.imageset")
+    master = None if is_crt else create_launch_logo(360, brand)
     for suffix, sz in [("LaunchLogo.png", 120), ("LaunchLogo@2x.png", 240), ("LaunchLogo@3x.png", 360)]:
-        logo = create_crt_launch_logo(sz, brand) if is_crt else create_launch_logo(sz, brand)
-        save(logo, os.path.join(logo_dir, suffix))
+        logo = create_crt_launch_logo(sz, brand) if is_crt else _downscale(master, sz, sz)
+        write(logo, os.path.join(logo_dir, suffix))
 
     # ── Launch Background ──────────────────────────────
-    print("\nLaunch Background:")
+    heading("\nLaunch Background:")
     bg_dir = os.path.join(assets, "LaunchBG.imageset")
     for suffix, sz in [("LaunchBG.png", 120), ("LaunchBG@2x.png", 240), ("LaunchBG@3x.png", 360)]:
         bg_img = Image.new("RGB", (sz, sz), CRT_BG if is_crt else tuple(int(c * 255) for c in brand["launch_bg_rgb"]))
-        save(bg_img, os.path.join(bg_dir, suffix), force_rgb=True)
+        write(bg_img, os.path.join(bg_dir, suffix), force_rgb=True)
 
     # ── tvOS App Icon (400×240) ────────────────────────
-    print("\ntvOS App Icon (400x240):")
+    heading("\ntvOS App Icon (400x240):")
     tv = os.path.join(assets, "tv.brandassets", "App Icon.imagestack")
     for w, h, tag in [(400, 240, "icon_400x240.png"), (800, 480, "icon_800x480.png")]:
         back = create_crt_tvos_back(w, h, brand) if is_crt else create_tvos_back(w, h, brand)
-        save(back, os.path.join(tv, "Back.imagestacklayer", "Content.imageset", tag), force_rgb=True)
-        save(create_tvos_middle(w, h), os.path.join(tv, "Middle.imagestacklayer", "Content.imageset", tag))
+        write(back, os.path.join(tv, "Back.imagestacklayer", "Content.imageset", tag), force_rgb=True)
+        write(create_tvos_middle(w, h), os.path.join(tv, "Middle.imagestacklayer", "Content.imageset", tag))
         front = create_crt_tvos_front(w, h, brand) if is_crt else create_tvos_front(w, h, brand)
-        save(front, os.path.join(tv, "Front.imagestacklayer", "Content.imageset", tag))
+        write(front, os.path.join(tv, "Front.imagestacklayer", "Content.imageset", tag))
 
     # ── tvOS App Store Icon (1280×768) ─────────────────
-    print("\ntvOS App Store Icon (1280x768):")
+    heading("\ntvOS App Store Icon (1280x768):")
     tvs = os.path.join(assets, "tv.brandassets", "App Icon - App Store.imagestack")
     tag = "icon_1280x768.png"
     back = create_crt_tvos_back(1280, 768, brand) if is_crt else create_tvos_back(1280, 768, brand)
-    save(back, os.path.join(tvs, "Back.imagestacklayer", "Content.imageset", tag), force_rgb=True)
-    save(create_tvos_middle(1280, 768), os.path.join(tvs, "Middle.imagestacklayer", "Content.imageset", tag))
+    write(back, os.path.join(tvs, "Back.imagestacklayer", "Content.imageset", tag), force_rgb=True)
+    write(create_tvos_middle(1280, 768), os.path.join(tvs, "Middle.imagestacklayer", "Content.imageset", tag))
     front = create_crt_tvos_front(1280, 768, brand) if is_crt else create_tvos_front(1280, 768, brand)
-    save(front, os.path.join(tvs, "Front.imagestacklayer", "Content.imageset", tag))
+    write(front, os.path.join(tvs, "Front.imagestacklayer", "Content.imageset", tag))
 
     # ── Top Shelf ──────────────────────────────────────
-    print("\nTop Shelf Image:")
+    heading("\nTop Shelf Image:")
     shelf = os.path.join(assets, "tv.brandassets", "Top Shelf Image.imageset")
     shelf_fn = create_crt_shelf_image if is_crt else create_shelf_image
-    save(shelf_fn(1920, 720, brand), os.path.join(shelf, "shelf_1920x720.png"), force_rgb=True)
-    save(shelf_fn(3840, 1440, brand), os.path.join(shelf, "shelf_3840x1440.png"), force_rgb=True)
+    shelf_2x = shelf_fn(3840, 1440, brand)
+    # Gradient 1x shelves are exact halves of the 2x render
+    shelf_1x = shelf_fn(1920, 720, brand) if is_crt else _downscale(shelf_2x, 1920, 720)
+    write(shelf_1x, os.path.join(shelf, "shelf_1920x720.png"), force_rgb=True)
+    write(shelf_2x, os.path.join(shelf, "shelf_3840x1440.png"), force_rgb=True)
 
-    print("\nTop Shelf Image Wide:")
+    heading("\nTop Shelf Image Wide:")
     shelfw = os.path.join(assets, "tv.brandassets", "Top Shelf Image Wide.imageset")
-    save(shelf_fn(2320, 720, brand), os.path.join(shelfw, "shelf_wide_2320x720.png"), force_rgb=True)
-    save(shelf_fn(4640, 1440, brand), os.path.join(shelfw, "shelf_wide_4640x1440.png"), force_rgb=True)
+    shelf_2x = shelf_fn(4640, 1440, brand)
+    shelf_1x = shelf_fn(2320, 720, brand) if is_crt else _downscale(shelf_2x, 2320, 720)
+    write(shelf_1x, os.path.join(shelfw, "shelf_wide_2320x720.png"), force_rgb=True)
+    write(shelf_2x, os.path.join(shelfw, "shelf_wide_4640x1440.png"), force_rgb=True)
+
+    pool.shutdown(wait=True)
+    for entry in log:
+        print(entry if isinstance(entry, str) else entry.result())
 
     # ── Color sets ─────────────────────────────────────
     print("\nColorsets:")
@@ -602,13 +769,25 @@ def main():
         choices=["nexuspvr", "dispatcherpvr", "all"],
         help="Which brand to generate assets for (or 'all' for both)",
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Use light PNG compression for quicker local iteration (larger files)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite every PNG even if its pixels match the last run",
+    )
     args = parser.parse_args()
 
+    manifest = {} if args.force else load_manifest()
     if args.brand == "all":
         for key in BRANDS:
-            generate(key)
+            generate(key, fast=args.fast, manifest=manifest)
     else:
-        generate(args.brand)
+        generate(args.brand, fast=args.fast, manifest=manifest)
+    write_manifest(manifest)
 
     print("Done.")
 